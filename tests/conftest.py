@@ -2,42 +2,46 @@
 Pytest configuration and fixtures for the Mergington High School API tests.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+import copy
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import orjson
+import pytest
+from httpx import ASGITransport, AsyncClient
 
 from app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Fixture that provides a test client for the FastAPI application."""
-    return TestClient(app)
+def jloads(response):
+    """Parse a JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """
+    Fixture that provides an async test client for the FastAPI application.
+    The client is shared across the whole session; tests only mutate
+    the activities database, which reset_activities restores.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def _pristine_activities():
+    """Fixture that captures the initial activities database once per session."""
+    return copy.deepcopy(activities)
 
 
 @pytest.fixture
-def reset_activities():
+def reset_activities(_pristine_activities):
     """
-    Fixture that resets the activities database before each test.
+    Fixture that resets the activities database after each test.
     This ensures test isolation by providing a clean state.
     """
-    # Store original state
-    original_activities = {
-        key: {
-            "description": val["description"],
-            "schedule": val["schedule"],
-            "max_participants": val["max_participants"],
-            "participants": val["participants"].copy()
-        }
-        for key, val in activities.items()
-    }
-    
     yield
-    
-    # Restore original state
-    for key, val in original_activities.items():
-        activities[key]["participants"] = val["participants"]
+
+    # Only participants are ever mutated, so restore just those sets
+    for key, val in _pristine_activities.items():
+        activities[key]["participants"] = val["participants"].copy()
@@ -4,27 +4,23 @@ Tests cover activity retrieval, signup, and unregistration functionality.
 """
 
 import pytest
-from conftest import activities
+from conftest import activities, jloads
 
 
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
     
-    def test_get_activities_success(self, client):
-        """Test that activities are returned successfully"""
-        response = client.get("/activities")
+    async def test_get_activities(self, client):
+        """Test that all activities are returned with their required fields"""
+        response = await client.get("/activities")
         assert response.status_code == 200
         
-        data = response.json()
+        data = jloads(response)
         assert isinstance(data, dict)
+        assert len(data) == 9  # 9 activities in total
         assert "Chess Club" in data
         assert "Programming Class" in data
         assert "Science Club" in data
-    
-    def test_activities_have_required_fields(self, client):
-        """Test that each activity has all required fields"""
-        response = client.get("/activities")
-        data = response.json()
         
         for activity_name, activity_details in data.items():
             assert "description" in activity_details
@@ -32,189 +28,155 @@ class TestGetActivities:
             assert "max_participants" in activity_details
             assert "participants" in activity_details
             assert isinstance(activity_details["participants"], list)
-    
-    def test_activities_count(self, client):
-        """Test that the correct number of activities are returned"""
-        response = client.get("/activities")
-        data = response.json()
-        assert len(data) == 9  # 9 activities in total
+        
+        # Participants are serialized as sorted lists
+        assert data["Chess Club"]["participants"] == [
+            "daniel@mergington.edu",
+            "michael@mergington.edu",
+        ]
 
 
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_success(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
+    @pytest.mark.parametrize("activity,email", [
+        ("Chess Club", "newstudent@mergington.edu"),
+        ("Programming Class", "newstudent@mergington.edu"),
+        ("Tennis Club", "newplayer@mergington.edu"),
+    ])
+    async def test_signup_success(self, client, reset_activities, activity, email):
+        """Test that signup adds the participant and keeps existing ones"""
+        existing_participants = set(activities[activity]["participants"])
+        response = await client.post(
+            f"/activities/{activity}/signup",
+            params={"email": email}
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
+        assert email in data["message"]
+        assert activity in data["message"]
+        
+        # Verify the participant was added alongside the original ones
+        assert activities[activity]["participants"] == existing_participants | {email}
     
-    def test_signup_adds_participant(self, client, reset_activities):
-        """Test that signup actually adds the participant to the activity"""
-        email = "newstudent@mergington.edu"
-        client.post("/activities/Programming Class/signup", params={"email": email})
-        
-        # Verify the participant was added
-        activities_response = client.get("/activities")
-        programming_class = activities_response.json()["Programming Class"]
-        assert email in programming_class["participants"]
+    async def test_signup_listed_in_sorted_order(self, client, reset_activities):
+        """Test that a new participant is returned in sorted position"""
+        email = "jane@mergington.edu"
+        response = await client.post(
+            "/activities/Chess Club/signup",
+            params={"email": email}
+        )
+        assert response.status_code == 200
+        
+        activities_response = await client.get("/activities")
+        assert activities_response.status_code == 200
+        assert jloads(activities_response)["Chess Club"]["participants"] == [
+            "daniel@mergington.edu",
+            email,
+            "michael@mergington.edu",
+        ]
     
-    def test_signup_nonexistent_activity(self, client):
+    async def test_signup_nonexistent_activity(self, client):
         """Test that signup returns 404 for non-existent activity"""
-        response = client.post(
+        response = await client.post(
             "/activities/Nonexistent Club/signup",
             params={"email": "student@mergington.edu"}
         )
         
         assert response.status_code == 404
-        data = response.json()
+        data = jloads(response)
         assert "Activity not found" in data["detail"]
     
-    def test_signup_duplicate_student(self, client, reset_activities):
+    async def test_signup_duplicate_student(self, client, reset_activities):
         """Test that a student cannot sign up twice for the same activity"""
         email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/signup",
             params={"email": email}
         )
         
         assert response.status_code == 400
-        data = response.json()
+        data = jloads(response)
         assert "already signed up" in data["detail"]
-    
-    def test_signup_new_student_existing_activity(self, client, reset_activities):
-        """Test that a new student can sign up for an activity with existing participants"""
-        response = client.post(
-            "/activities/Tennis Club/signup",
-            params={"email": "newplayer@mergington.edu"}
-        )
-        
-        assert response.status_code == 200
-        
-        # Verify participant was added
-        activities_response = client.get("/activities")
-        tennis_club = activities_response.json()["Tennis Club"]
-        assert "newplayer@mergington.edu" in tennis_club["participants"]
-        assert "sarah@mergington.edu" in tennis_club["participants"]  # Original participant
 
 
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/signup endpoint"""
     
-    def test_unregister_success(self, client, reset_activities):
-        """Test successful unregistration from an activity"""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.delete(
-            "/activities/Chess Club/signup",
+    @pytest.mark.parametrize("activity,email", [
+        ("Chess Club", "michael@mergington.edu"),
+        ("Chess Club", "daniel@mergington.edu"),
+        ("Theatre Club", "lucas@mergington.edu"),
+    ])
+    async def test_unregister_success(self, client, reset_activities, activity, email):
+        """Test that unregister removes only the targeted participant"""
+        remaining_participants = activities[activity]["participants"] - {email}
+        response = await client.delete(
+            f"/activities/{activity}/signup",
             params={"email": email}
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert "message" in data
         assert email in data["message"]
+        
+        # Verify only the targeted participant was removed
+        assert activities[activity]["participants"] == remaining_participants
     
-    def test_unregister_removes_participant(self, client, reset_activities):
-        """Test that unregister actually removes the participant"""
-        email = "daniel@mergington.edu"  # In Chess Club
-        client.delete("/activities/Chess Club/signup", params={"email": email})
-        
-        # Verify the participant was removed
-        activities_response = client.get("/activities")
-        chess_club = activities_response.json()["Chess Club"]
-        assert email not in chess_club["participants"]
-    
-    def test_unregister_nonexistent_activity(self, client):
+    async def test_unregister_nonexistent_activity(self, client):
         """Test that unregister returns 404 for non-existent activity"""
-        response = client.delete(
+        response = await client.delete(
             "/activities/Nonexistent Club/signup",
             params={"email": "student@mergington.edu"}
         )
         
         assert response.status_code == 404
-        data = response.json()
+        data = jloads(response)
         assert "Activity not found" in data["detail"]
     
-    def test_unregister_student_not_registered(self, client, reset_activities):
+    async def test_unregister_student_not_registered(self, client, reset_activities):
         """Test that unregister returns 400 if student is not registered"""
-        response = client.delete(
+        response = await client.delete(
             "/activities/Art Studio/signup",
             params={"email": "notregistered@mergington.edu"}
         )
         
         assert response.status_code == 400
-        data = response.json()
+        data = jloads(response)
         assert "not signed up" in data["detail"]
-    
-    def test_unregister_from_activity_with_multiple_participants(self, client, reset_activities):
-        """Test unregistering from an activity that has multiple participants"""
-        # Theatre Club has lucas and ava
-        response = client.delete(
-            "/activities/Theatre Club/signup",
-            params={"email": "lucas@mergington.edu"}
-        )
-        
-        assert response.status_code == 200
-        
-        # Verify only the targeted participant was removed
-        activities_response = client.get("/activities")
-        theatre_club = activities_response.json()["Theatre Club"]
-        assert "lucas@mergington.edu" not in theatre_club["participants"]
-        assert "ava@mergington.edu" in theatre_club["participants"]
 
 
 class TestSignupAndUnregisterWorkflow:
     """Tests for combined signup and unregistration workflows"""
     
-    def test_signup_then_unregister(self, client, reset_activities):
-        """Test signing up and then unregistering from an activity"""
+    async def test_full_workflow(self, client, reset_activities):
+        """Test signing up for multiple activities and then unregistering from one"""
         email = "workflow@mergington.edu"
-        
-        # Sign up
-        signup_response = client.post(
-            "/activities/Gym Class/signup",
-            params={"email": email}
-        )
-        assert signup_response.status_code == 200
-        
-        # Verify signup
-        check_response = client.get("/activities")
-        assert email in check_response.json()["Gym Class"]["participants"]
-        
-        # Unregister
-        unregister_response = client.delete(
-            "/activities/Gym Class/signup",
-            params={"email": email}
-        )
-        assert unregister_response.status_code == 200
-        
-        # Verify unregistration
-        final_check = client.get("/activities")
-        assert email not in final_check.json()["Gym Class"]["participants"]
-    
-    def test_signup_multiple_activities(self, client, reset_activities):
-        """Test signing up for multiple activities"""
-        email = "multiactivity@mergington.edu"
+        signup_activities = ["Chess Club", "Programming Class", "Gym Class"]
         
         # Sign up for multiple activities
-        for activity in ["Chess Club", "Programming Class", "Art Studio"]:
-            response = client.post(
+        for activity in signup_activities:
+            response = await client.post(
                 f"/activities/{activity}/signup",
                 params={"email": email}
             )
             assert response.status_code == 200
         
         # Verify signup for all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
+        for activity in signup_activities:
+            assert email in activities[activity]["participants"]
+        
+        # Unregister
+        unregister_response = await client.delete(
+            "/activities/Gym Class/signup",
+            params={"email": email}
+        )
+        assert unregister_response.status_code == 200
         
-        assert email in activities_data["Chess Club"]["participants"]
-        assert email in activities_data["Programming Class"]["participants"]
-        assert email in activities_data["Art Studio"]["participants"]
+        # Verify unregistration only affected Gym Class
+        assert email not in activities["Gym Class"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+        assert email in activities["Programming Class"]["participants"]